@@ -0,0 +1,41 @@
+"""JSON backend selected at import time: orjson, then ujson, then stdlib json.
+
+All ``dumps`` variants return UTF-8 bytes, ready for a websocket frame or
+``sys.stdout.buffer``.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+    dumps = orjson.dumps
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    try:
+        import ujson
+
+        JSONDecodeError = ujson.JSONDecodeError
+        loads = ujson.loads
+
+        def dumps(obj: Any) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+        def dumps_pretty(obj: Any) -> bytes:
+            return ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False, indent=2
+            ).encode()
+    except ImportError:
+        JSONDecodeError = json.JSONDecodeError
+        loads = json.loads
+
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+        def dumps_pretty(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode()
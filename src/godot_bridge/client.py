@@ -1,20 +1,96 @@
 """WebSocket JSON-RPC client for Godot Bridge."""
 
-import json
+import atexit
+import logging
 import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-from loguru import logger
-from pydantic import BaseModel
+from queue import Empty, SimpleQueue
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
 
+from ._json import JSONDecodeError, dumps, loads
 
-class GodotConfig(BaseModel):
+logger = logging.getLogger("godot_bridge")
+logger.addHandler(logging.NullHandler())
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+
+if msgspec is not None:
+    class _Response(msgspec.Struct):
+        """JSON-RPC response envelope; result is left untyped."""
+        id: Any = None
+        result: Any = msgspec.field(default_factory=dict)
+        error: Any = None
+
+    class _RawResponse(msgspec.Struct):
+        """JSON-RPC response envelope; result is kept as the JSON bytes received."""
+        id: Any = None
+        result: msgspec.Raw = msgspec.Raw(b"{}")
+        error: Any = None
+
+    def _make_codec() -> tuple[
+        Callable[[Any], bytes], Callable[[bytes], _Response], Callable[[bytes], _RawResponse]
+    ]:
+        """Create a request encoder and typed response decoders.
+
+        Typed decoding fills the envelope directly without an intermediate dict.
+        """
+        return (
+            msgspec.json.Encoder().encode,
+            msgspec.json.Decoder(_Response).decode,
+            msgspec.json.Decoder(_RawResponse).decode,
+        )
+else:
+    class _Response(NamedTuple):
+        """JSON-RPC response envelope; result is left untyped."""
+        id: Any
+        result: Any
+        error: Any
+
+    def _decode_response(data: str | bytes) -> _Response:
+        response = loads(data)
+        return _Response(response.get("id"), response.get("result", {}), response.get("error"))
+
+    _RawResponse = _Response
+
+    def _decode_raw_response(data: str | bytes) -> _RawResponse:
+        response = loads(data)
+        result = dumps(response.get("result", {}))
+        return _RawResponse(response.get("id"), result, response.get("error"))
+
+    def _make_codec() -> tuple[
+        Callable[[Any], bytes], Callable[[bytes], _Response], Callable[[bytes], _RawResponse]
+    ]:
+        """Return the module-level request encoder and response decoders."""
+        return dumps, _decode_response, _decode_raw_response
+
+
+@dataclass(frozen=True, slots=True)
+class GodotConfig:
     """Connection configuration."""
     ws_url: str = "ws://127.0.0.1:49631"
     token: str = ""
     token_file: str = ""
 
 
+def _normalize_id(value: Any) -> Any:
+    """Map an id echoed back as a string to the integer we sent."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return value
+
+
 class RPCError(Exception):
     """JSON-RPC error from Godot."""
     def __init__(self, code: int, message: str, data: Any = None):
@@ -23,6 +99,51 @@ class RPCError(Exception):
         self.data = data
         super().__init__(f"RPC Error {code}: {message}")
 
+    @classmethod
+    def from_response(cls, error: dict[str, Any]) -> "RPCError":
+        """Build from the ``error`` member of a JSON-RPC response."""
+        return cls(
+            error.get("code", -1),
+            error.get("message", "Unknown error"),
+            error.get("data")
+        )
+
+
+# Returned by a call source's take() when nothing is queued yet / no calls remain
+_NOT_READY = object()
+_DONE = object()
+
+
+class _IterCalls:
+    """Call source over an iterable of (method, params) pairs."""
+
+    def __init__(self, calls: Iterable[tuple[str, dict[str, Any] | None]]):
+        self._calls = iter(calls)
+
+    def take(self, block: bool) -> Any:
+        return next(self._calls, _DONE)
+
+
+class CallQueue:
+    """Thread-safe call source for call_many, fed while results are consumed."""
+
+    def __init__(self):
+        self._queue: SimpleQueue = SimpleQueue()
+
+    def put(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Queue a call."""
+        self._queue.put((method, params))
+
+    def close(self) -> None:
+        """Mark the end of the calls; call_many returns once they are answered."""
+        self._queue.put(_DONE)
+
+    def take(self, block: bool) -> Any:
+        try:
+            return self._queue.get(block)
+        except Empty:
+            return _NOT_READY
+
 
 class GodotClient:
     """Synchronous WebSocket client for Godot Editor."""
@@ -32,6 +153,12 @@ class GodotClient:
         self.ws = None
         self.request_id = 0
         self.authenticated = False
+        # Request envelopes reused across calls to avoid per-call dict allocation;
+        # params is omitted entirely (as JSON-RPC allows) when the call has none
+        self._req: dict[str, Any] = {"jsonrpc": "2.0", "id": 0, "method": "", "params": None}
+        self._req_no_params: dict[str, Any] = {"jsonrpc": "2.0", "id": 0, "method": ""}
+        # Built once per client so every call reuses the encoder buffers and decoder type info
+        self._encode, self._decode, self._decode_raw = _make_codec()
 
     def _load_config(self) -> GodotConfig:
         """Load config from environment."""
@@ -46,16 +173,16 @@ class GodotClient:
                 content = token_path.read_text().strip()
                 # Handle JSON format (GodotBridge uses JSON with token field)
                 try:
-                    data = json.loads(content)
+                    data = loads(content)
                     token = data.get("token", content)
                     # Also get port from JSON if available
                     if "port" in data:
                         ws_url = f"ws://127.0.0.1:{data['port']}"
-                    logger.debug(f"Loaded token from JSON file {token_file}")
-                except json.JSONDecodeError:
+                    logger.debug("Loaded token from JSON file %s", token_file)
+                except JSONDecodeError:
                     # Plain text token
                     token = content
-                    logger.debug(f"Loaded token from {token_file}")
+                    logger.debug("Loaded token from %s", token_file)
 
         return GodotConfig(ws_url=ws_url, token=token, token_file=token_file)
 
@@ -63,8 +190,16 @@ class GodotClient:
         """Connect and authenticate with Godot."""
         try:
             import websockets.sync.client as ws_client
-            logger.info(f"Connecting to Godot at {self.config.ws_url}...")
-            self.ws = ws_client.connect(self.config.ws_url, close_timeout=5)
+            logger.info("Connecting to Godot at %s...", self.config.ws_url)
+            # permessage-deflate only costs CPU on loopback; keep it for remote editors
+            local = urlsplit(self.config.ws_url).hostname in _LOOPBACK_HOSTS
+            self.ws = ws_client.connect(
+                self.config.ws_url,
+                open_timeout=3,
+                close_timeout=5,
+                compression=None if local else "deflate",
+                max_size=None,
+            )
 
             # Authenticate
             result = self.call("auth.hello", {
@@ -75,51 +210,144 @@ class GodotClient:
 
             if result.get("ok"):
                 self.authenticated = True
-                logger.info(f"Connected to Godot {result.get('editor_version', 'unknown')}")
+                logger.info("Connected to Godot %s", result.get("editor_version", "unknown"))
                 return True
             else:
                 logger.error("Authentication failed")
                 return False
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             return False
 
+    def _send(self, method: str, params: dict[str, Any] | None) -> int:
+        """Send a request and return its id."""
+        self.request_id += 1
+        rid = self.request_id
+        if params is None:
+            request = self._req_no_params
+        else:
+            request = self._req
+            request["params"] = params
+        request["id"] = rid
+        request["method"] = method
+
+        logger.debug("RPC call: %s", method)
+        # msgspec/orjson yield UTF-8 bytes; send them as a text frame without re-encoding
+        self.ws.send(self._encode(request), text=True)
+        return rid
+
+    @staticmethod
+    def _result(response: _Response) -> dict[str, Any]:
+        """Extract result from a response, raising RPCError on error."""
+        error = response.error
+        if error is not None:
+            raise RPCError.from_response(error)
+        return response.result
+
     def call(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Call JSON-RPC method on Godot."""
         if self.ws is None:
             raise RuntimeError("Not connected to Godot")
 
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": str(self.request_id),
-            "method": method,
-            "params": params or {}
-        }
-
-        logger.debug(f"RPC call: {method}")
-        self.ws.send(json.dumps(request))
-
-        while True:
-            response_text = self.ws.recv()
-            response = json.loads(response_text)
-
-            if response.get("id") == str(self.request_id):
-                if "error" in response:
-                    error = response["error"]
-                    raise RPCError(
-                        error.get("code", -1),
-                        error.get("message", "Unknown error"),
-                        error.get("data")
-                    )
-                return response.get("result", {})
+        try:
+            rid = self._send(method, params)
+
+            # One request in flight, so the next frame must be its response.
+            # decode=False hands the raw UTF-8 payload to the parser, skipping str decoding.
+            response = self._decode(self.ws.recv(decode=False))
+            if response.id != rid and _normalize_id(response.id) != rid:
+                raise RPCError(-32603, "id mismatch", {"expected": rid, "received": response.id})
+        except BaseException:
+            # The stream is broken or out of step; drop it so the next call reconnects
+            self.close()
+            raise
+        return self._result(response)
+
+    def call_raw(self, method: str, params: dict[str, Any] | None = None) -> memoryview:
+        """Call JSON-RPC method and return the result as the JSON bytes received.
+
+        With msgspec the result is sliced out of the frame as-is, so large
+        results are neither parsed into Python objects nor re-serialized.
+        Without it the result is decoded and serialized again.
+        """
+        if self.ws is None:
+            raise RuntimeError("Not connected to Godot")
+
+        try:
+            rid = self._send(method, params)
+
+            response = self._decode_raw(self.ws.recv(decode=False))
+            if response.id != rid and _normalize_id(response.id) != rid:
+                raise RPCError(-32603, "id mismatch", {"expected": rid, "received": response.id})
+        except BaseException:
+            # The stream is broken or out of step; drop it so the next call reconnects
+            self.close()
+            raise
+        return memoryview(self._result(response))
+
+    def call_many(
+        self,
+        calls: Iterable[tuple[str, dict[str, Any] | None]] | CallQueue,
+        window: int = 16,
+    ) -> Iterator[dict[str, Any] | RPCError]:
+        """Pipeline JSON-RPC calls, yielding results in request order.
+
+        Up to ``window`` requests are kept in flight. Per-call errors are
+        yielded as RPCError instead of raised so one failure doesn't abort
+        the batch.
+
+        ``calls`` is either an iterable of (method, params) pairs or a
+        CallQueue fed by another thread. A queue is only waited on when no
+        responses are outstanding, so results are yielded as they arrive.
+        """
+        if self.ws is None:
+            raise RuntimeError("Not connected to Godot")
+
+        source = calls if isinstance(calls, CallQueue) else _IterCalls(calls)
+        pending: deque[int] = deque()
+        received: dict[int, _Response] = {}
+        done = False
+        try:
+            while True:
+                while not done and len(pending) < window:
+                    call = source.take(block=not pending)
+                    if call is _NOT_READY:
+                        break
+                    if call is _DONE:
+                        done = True
+                    else:
+                        pending.append(self._send(*call))
+                if not pending:
+                    return
+
+                rid = pending.popleft()
+                while rid not in received:
+                    response = self._decode(self.ws.recv(decode=False))
+                    response_id = _normalize_id(response.id)
+                    if response_id != rid and response_id not in pending:
+                        raise RPCError(-32603, "id mismatch",
+                                       {"expected": rid, "received": response_id})
+                    received[response_id] = response
+                try:
+                    result = self._result(received.pop(rid))
+                except RPCError as e:
+                    result = e
+                yield result
+        except GeneratorExit:
+            # Stopped early: unread responses would be picked up by the next call
+            if pending or received:
+                self.close()
+            raise
+        except BaseException:
+            self.close()
+            raise
 
     def close(self) -> None:
         """Close connection."""
         if self.ws:
-            self.ws.close()
-            self.ws = None
+            ws, self.ws = self.ws, None
             self.authenticated = False
+            ws.close()
 
     def __enter__(self):
         self.connect()
@@ -129,8 +357,50 @@ class GodotClient:
         self.close()
 
 
+_shared_client: GodotClient | None = None
+
+
+def persistence_enabled() -> bool:
+    """Whether GODOT_BRIDGE_PERSIST asks for a reused connection."""
+    return os.environ.get("GODOT_BRIDGE_PERSIST") == "1"
+
+
+def get_shared_client(check: bool = False) -> GodotClient:
+    """Get process-wide client, connecting on first use.
+
+    With ``check``, an already open connection is verified with a cheap
+    auth.ping and re-established if that fails, instead of re-authenticating.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = GodotClient()
+        atexit.register(_shared_client.close)
+    elif check and _shared_client.ws is not None:
+        try:
+            _shared_client.call("auth.ping")
+        except Exception as e:
+            logger.debug("Shared connection is stale, reconnecting: %s", e)
+            _shared_client.close()
+    if _shared_client.ws is None:
+        _shared_client.connect()
+    return _shared_client
+
+
 # Convenience function for single calls
 def godot_call(method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Execute single RPC call to Godot."""
+    """Execute single RPC call to Godot.
+
+    With GODOT_BRIDGE_PERSIST=1 the connection is kept open and reused.
+    """
+    if persistence_enabled():
+        return get_shared_client().call(method, params)
     with GodotClient() as client:
         return client.call(method, params)
+
+
+def godot_call_raw(method: str, params: dict[str, Any] | None = None) -> memoryview:
+    """Execute single RPC call to Godot, returning the raw result JSON."""
+    if persistence_enabled():
+        return get_shared_client().call_raw(method, params)
+    with GodotClient() as client:
+        return client.call_raw(method, params)
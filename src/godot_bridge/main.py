@@ -1,62 +1,202 @@
 """Godot Bridge CLI - Unified Godot Editor control."""
 
-import json
+import inspect
+import logging
 import sys
-from typing import Annotated, Optional
+import threading
+from collections import deque
+from functools import cache, lru_cache, wraps
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Optional
 
 import typer
-from loguru import logger
-from rich.console import Console
-from rich.table import Table
 
-from .client import GodotClient, RPCError, godot_call
+if TYPE_CHECKING:
+    from rich.console import Console
+
+from ._json import JSONDecodeError, dumps, dumps_pretty, loads
+from .client import (
+    CallQueue,
+    GodotClient,
+    RPCError,
+    get_shared_client,
+    godot_call,
+    godot_call_raw,
+    persistence_enabled,
+)
 
-# Configure loguru for stderr
-logger.remove()
-logger.add(sys.stderr, level="WARNING", format="{message}")
+# Log warnings and errors to stderr
+logger = logging.getLogger("godot_bridge")
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_log_handler)
+logger.setLevel(logging.WARNING)
 
 app = typer.Typer(
     name="godot-bridge",
     help="Unified CLI for Godot Editor control via WebSocket",
     no_args_is_help=True,
 )
-console = Console()
+
+
+@cache
+def _console() -> "Console":
+    """Get the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
 
 # Common options
 JsonOutput = Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")]
 Verbose = Annotated[bool, typer.Option("--verbose", "-v", help="Enable debug logging")]
+RawOutput = Annotated[bool, typer.Option("--raw", help="Write file content as-is")]
+RawResult = Annotated[bool, typer.Option("--raw", help="Write the result JSON unformatted")]
 
 
-def output_result(data: dict, as_json: bool = False) -> None:
-    """Output result in requested format."""
-    if as_json:
-        print(json.dumps({"ok": True, "data": data}, indent=2))
+def _write_json(obj: Any) -> None:
+    """Write indented JSON straight to stdout."""
+    out = sys.stdout.buffer
+    out.write(dumps_pretty(obj))
+    out.write(b"\n")
+
+
+def _emit_json(data: dict) -> None:
+    _write_json({"ok": True, "data": data})
+
+
+def _emit_plain(data: dict) -> None:
+    # No colors when piped, so skip rich's re-parse and highlight pass
+    _write_json(data)
+
+
+def _emit_rich(data: dict) -> None:
+    _console().print_json(data=data)
+
+
+def _emit_error_json(error: Exception) -> None:
+    err_data = {"type": "rpc_error" if isinstance(error, RPCError) else "error"}
+    if isinstance(error, RPCError):
+        err_data["code"] = error.code
+        err_data["message"] = error.message
+        if error.data:
+            err_data["details"] = error.data
     else:
-        console.print_json(data=data)
+        err_data["message"] = str(error)
+    _write_json({"ok": False, "error": err_data})
+
 
+def _emit_error_plain(error: Exception) -> None:
+    print(f"Error: {error}")
 
-def output_error(error: Exception, as_json: bool = False) -> None:
+
+def _emit_error_rich(error: Exception) -> None:
+    _console().print(f"[red]Error:[/red] {error}")
+
+
+def output_result(ctx: typer.Context, data: dict) -> None:
+    """Output result in requested format."""
+    ctx.obj["emit"](data)
+
+
+def output_error(ctx: typer.Context, error: Exception) -> None:
     """Output error in requested format."""
-    if as_json:
-        err_data = {"type": "rpc_error" if isinstance(error, RPCError) else "error"}
-        if isinstance(error, RPCError):
-            err_data["code"] = error.code
-            err_data["message"] = error.message
-            if error.data:
-                err_data["details"] = error.data
-        else:
-            err_data["message"] = str(error)
-        print(json.dumps({"ok": False, "error": err_data}, indent=2))
-    else:
-        console.print(f"[red]Error:[/red] {error}")
+    ctx.obj["emit_error"](error)
     raise typer.Exit(1)
 
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging level."""
     if verbose:
-        logger.remove()
-        logger.add(sys.stderr, level="DEBUG", format="{time:HH:mm:ss} | {level} | {message}")
+        logger.setLevel(logging.DEBUG)
+        _log_handler.setFormatter(
+            logging.Formatter("%(asctime)s | %(levelname)s | %(message)s", "%H:%M:%S")
+        )
+
+
+@lru_cache(maxsize=128)
+def _parse_json_cached(value: str) -> Any:
+    return loads(value)
+
+
+def parse_json(value: str) -> Any:
+    """Parse a JSON command-line argument.
+
+    Results are cached, so repeated payloads (e.g. retries in a persistent
+    process) skip parsing; callers must not mutate the returned value.
+    """
+    try:
+        return _parse_json_cached(value)
+    except JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+
+def output_raw(data: dict, field: str) -> None:
+    """Write a text field of the result to stdout as-is."""
+    if field not in data:
+        raise ValueError(f"Response has no '{field}' field")
+    sys.stdout.buffer.write(data[field].encode())
+
+
+def output_raw_json(result: memoryview) -> None:
+    """Write result JSON bytes to stdout without re-serializing them."""
+    out = sys.stdout.buffer
+    out.write(result)
+    out.write(b"\n")
+
+
+def rpc_command(
+    method: str,
+    raw_field: str | None = None,
+    raw_result: bool = False,
+) -> Callable[[Callable[..., dict | None]], Callable[..., None]]:
+    """Turn a params builder into a command that calls ``method``.
+
+    The decorated function receives the command's arguments and returns the
+    RPC params (or None). The wrapper performs the call and renders the
+    result or error. With ``raw_field`` it also adds --raw, which writes
+    that result field verbatim instead; with ``raw_result``, --raw writes
+    the result JSON unformatted (as received from Godot when msgspec is
+    installed).
+    """
+    def decorator(fn: Callable[..., dict | None]) -> Callable[..., None]:
+        @wraps(fn)
+        def wrapper(*args, ctx: typer.Context, raw: bool = False, **kwargs) -> None:
+            if raw and ctx.obj["json"]:
+                raise typer.BadParameter("cannot be combined with --json", param_hint="'--raw'")
+            try:
+                params = fn(*args, **kwargs)
+                if not raw:
+                    output_result(ctx, godot_call(method, params))
+                elif raw_field:
+                    output_raw(godot_call(method, params), raw_field)
+                else:
+                    output_raw_json(godot_call_raw(method, params))
+            except Exception as e:
+                output_error(ctx, e)
+
+        sig = inspect.signature(fn)
+        params = [
+            *sig.parameters.values(),
+            inspect.Parameter("ctx", inspect.Parameter.KEYWORD_ONLY, annotation=typer.Context),
+        ]
+        if raw_field or raw_result:
+            params.append(inspect.Parameter("raw", inspect.Parameter.KEYWORD_ONLY, default=False,
+                                            annotation=RawOutput if raw_field else RawResult))
+        wrapper.__signature__ = sig.replace(parameters=params)
+        return wrapper
+    return decorator
+
+
+@app.callback()
+def main(ctx: typer.Context, json_out: JsonOutput = False, verbose: Verbose = False):
+    """Unified CLI for Godot Editor control via WebSocket."""
+    setup_logging(verbose)
+    # Pick the output format once instead of re-checking it for every result
+    if json_out:
+        ctx.obj = {"json": True, "emit": _emit_json, "emit_error": _emit_error_json}
+    elif sys.stdout.isatty():
+        ctx.obj = {"json": False, "emit": _emit_rich, "emit_error": _emit_error_rich}
+    else:
+        ctx.obj = {"json": False, "emit": _emit_plain, "emit_error": _emit_error_plain}
 
 
 # ============================================================================
@@ -68,52 +208,28 @@ app.add_typer(project_app, name="project")
 
 
 @project_app.command("info")
-def project_info(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("project.get_info")
+def project_info():
     """Get project information."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("project.get_info")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @project_app.command("autoloads")
-def project_autoloads(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("project.get_autoloads")
+def project_autoloads():
     """List autoload singletons."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("project.get_autoloads")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @project_app.command("input-map")
-def project_input_map(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("project.get_input_map")
+def project_input_map():
     """Get input action mappings."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("project.get_input_map")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @project_app.command("add-input")
-def project_add_input(
-    action: str,
-    key: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("project.add_input_action")
+def project_add_input(action: str, key: str):
     """Add input action with key binding."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("project.add_input_action", {"action": action, "key": key})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"action": action, "key": key}
 
 
 # ============================================================================
@@ -125,47 +241,27 @@ app.add_typer(editor_app, name="editor")
 
 
 @editor_app.command("state")
-def editor_state(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("editor.get_state")
+def editor_state():
     """Get current editor state."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("editor.get_state")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @editor_app.command("logs")
-def editor_logs(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("editor.get_logs")
+def editor_logs():
     """Get editor logs."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("editor.get_logs")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @editor_app.command("clear-logs")
-def editor_clear_logs(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("editor.clear_logs")
+def editor_clear_logs():
     """Clear editor logs."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("editor.clear_logs")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @editor_app.command("save-all")
-def editor_save_all(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("editor.save_all")
+def editor_save_all():
     """Save all open scenes."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("editor.save_all")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 # ============================================================================
@@ -177,85 +273,43 @@ app.add_typer(scene_app, name="scene")
 
 
 @scene_app.command("open")
-def scene_open(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("editor.open_scene")
+def scene_open(path: str):
     """Open a scene file."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("editor.open_scene", {"scene_path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"scene_path": path}
 
 
 @scene_app.command("save")
-def scene_save(
-    path: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("editor.save_scene")
+def scene_save(path: Optional[str] = None):
     """Save current scene."""
-    setup_logging(verbose)
-    try:
-        params = {"scene_path": path} if path else {}
-        result = godot_call("editor.save_scene", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"scene_path": path} if path else {}
 
 
 @scene_app.command("create")
-def scene_create(
-    root_type: str,
-    path: str,
-    name: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.create_scene")
+def scene_create(root_type: str, path: str, name: Optional[str] = None):
     """Create a new scene."""
-    setup_logging(verbose)
-    try:
-        params = {"root_type": root_type, "scene_path": path}
-        if name:
-            params["root_name"] = name
-        result = godot_call("scene.create_scene", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    params = {"root_type": root_type, "scene_path": path}
+    if name:
+        params["root_name"] = name
+    return params
 
 
 @scene_app.command("tree")
-def scene_tree(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("scene.get_tree", raw_result=True)
+def scene_tree():
     """Get scene tree hierarchy."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.get_tree")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @scene_app.command("instance")
-def scene_instance(
-    parent: str,
-    scene_path: str,
-    name: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.instance_scene")
+def scene_instance(parent: str, scene_path: str, name: Optional[str] = None):
     """Instance a scene as child of parent node."""
-    setup_logging(verbose)
-    try:
-        params = {"parent_path": parent, "scene_path": scene_path}
-        if name:
-            params["name"] = name
-        result = godot_call("scene.instance_scene", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    params = {"parent_path": parent, "scene_path": scene_path}
+    if name:
+        params["name"] = name
+    return params
 
 
 # ============================================================================
@@ -267,159 +321,69 @@ app.add_typer(node_app, name="node")
 
 
 @node_app.command("list")
-def node_list(
-    parent: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.list_nodes")
+def node_list(parent: Optional[str] = None):
     """List child nodes."""
-    setup_logging(verbose)
-    try:
-        params = {"parent_path": parent} if parent else {}
-        result = godot_call("scene.list_nodes", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"parent_path": parent} if parent else {}
 
 
 @node_app.command("get")
-def node_get(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.get_node")
+def node_get(path: str):
     """Get node details."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.get_node", {"node_path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path}
 
 
 @node_app.command("props")
-def node_props(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.get_node_properties")
+def node_props(path: str):
     """Get node properties."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.get_node_properties", {"node_path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path}
 
 
 @node_app.command("set")
-def node_set(
-    path: str,
-    props: str,  # JSON string
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.set_node_properties")
+def node_set(path: str, props: str):
     """Set node properties (pass properties as JSON string)."""
-    setup_logging(verbose)
-    try:
-        properties = json.loads(props)
-        result = godot_call("scene.set_node_properties", {
-            "node_path": path,
-            "properties": properties
-        })
-        output_result(result, json_out)
-    except json.JSONDecodeError as e:
-        output_error(ValueError(f"Invalid JSON: {e}"), json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path, "properties": parse_json(props)}
 
 
 @node_app.command("add")
-def node_add(
-    parent: str,
-    type: str,
-    name: str,
-    props: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.add_node")
+def node_add(parent: str, type: str, name: str, props: Optional[str] = None):
     """Add a new node."""
-    setup_logging(verbose)
-    try:
-        params = {"parent_path": parent, "type": type, "name": name}
-        if props:
-            params["properties"] = json.loads(props)
-        result = godot_call("scene.add_node", params)
-        output_result(result, json_out)
-    except json.JSONDecodeError as e:
-        output_error(ValueError(f"Invalid JSON: {e}"), json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    params = {"parent_path": parent, "type": type, "name": name}
+    if props:
+        params["properties"] = parse_json(props)
+    return params
 
 
 @node_app.command("remove")
-def node_remove(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.remove_node")
+def node_remove(path: str):
     """Remove a node."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.remove_node", {"node_path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path}
 
 
 @node_app.command("rename")
-def node_rename(
-    path: str,
-    new_name: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.rename_node")
+def node_rename(path: str, new_name: str):
     """Rename a node."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.rename_node", {"node_path": path, "new_name": new_name})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path, "new_name": new_name}
 
 
 @node_app.command("duplicate")
-def node_duplicate(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.duplicate_node")
+def node_duplicate(path: str):
     """Duplicate a node."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.duplicate_node", {"node_path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path}
 
 
 @node_app.command("reparent")
-def node_reparent(
-    path: str,
-    new_parent: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.reparent_node")
+def node_reparent(path: str, new_parent: str):
     """Reparent a node."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.reparent_node", {
-            "node_path": path,
-            "new_parent_path": new_parent
-        })
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": path, "new_parent_path": new_parent}
 
 
 # ============================================================================
@@ -431,59 +395,33 @@ app.add_typer(script_app, name="script")
 
 
 @script_app.command("read")
-def script_read(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.read_text", raw_field="content")
+def script_read(path: str):
     """Read script content."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.read_text", {"path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"path": path}
 
 
 @script_app.command("write")
+@rpc_command("filesystem.write_text")
 def script_write(
     path: str,
     content: Optional[str] = None,
     file: Optional[str] = typer.Option(None, "--file", "-f", help="Read content from file"),
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
 ):
     """Write script content."""
-    setup_logging(verbose)
-    try:
-        if file:
-            from pathlib import Path
-            content = Path(file).read_text()
-        if not content:
-            output_error(ValueError("Provide content or --file"), json_out)
-        result = godot_call("filesystem.write_text", {"path": path, "content": content})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    if file:
+        from pathlib import Path
+        content = Path(file).read_text()
+    if not content:
+        raise ValueError("Provide content or --file")
+    return {"path": path, "content": content}
 
 
 @script_app.command("assign")
-def script_assign(
-    node: str,
-    script: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.assign_script")
+def script_assign(node: str, script: str):
     """Assign script to node."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("scene.assign_script", {
-            "node_path": node,
-            "script_path": script
-        })
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"node_path": node, "script_path": script}
 
 
 # ============================================================================
@@ -495,47 +433,27 @@ app.add_typer(play_app, name="play")
 
 
 @play_app.command("run")
-def play_run(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("play.run_main")
+def play_run():
     """Run main scene."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("play.run_main")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @play_app.command("current")
-def play_current(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("play.run_current")
+def play_current():
     """Run current scene."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("play.run_current")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @play_app.command("stop")
-def play_stop(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("play.stop")
+def play_stop():
     """Stop running game."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("play.stop")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 @play_app.command("state")
-def play_state(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("play.get_state")
+def play_state():
     """Get play state."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("play.get_state")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 # ============================================================================
@@ -547,84 +465,47 @@ app.add_typer(resource_app, name="resource")
 
 
 @resource_app.command("material")
+@rpc_command("resources.create_material")
 def resource_material(
     node: str,
     material_type: str = "StandardMaterial3D",
     props: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
 ):
     """Create and apply material to node."""
-    setup_logging(verbose)
-    try:
-        params = {"node_path": node, "material_type": material_type}
-        if props:
-            params["properties"] = json.loads(props)
-        result = godot_call("resources.create_material", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    params = {"node_path": node, "material_type": material_type}
+    if props:
+        params["properties"] = parse_json(props)
+    return params
 
 
 @resource_app.command("mesh")
-def resource_mesh(
-    node: str,
-    mesh_type: str,
-    params: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("scene.create_mesh")
+def resource_mesh(node: str, mesh_type: str, params: Optional[str] = None):
     """Create mesh on MeshInstance3D."""
-    setup_logging(verbose)
-    try:
-        call_params = {"node_path": node, "mesh_type": mesh_type}
-        if params:
-            call_params["mesh_params"] = json.loads(params)
-        result = godot_call("scene.create_mesh", call_params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    call_params = {"node_path": node, "mesh_type": mesh_type}
+    if params:
+        call_params["mesh_params"] = parse_json(params)
+    return call_params
 
 
 @resource_app.command("light")
-def resource_light(
-    parent: str,
-    light_type: str,
-    name: str,
-    props: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("resources.create_light")
+def resource_light(parent: str, light_type: str, name: str, props: Optional[str] = None):
     """Create light node."""
-    setup_logging(verbose)
-    try:
-        params = {"parent_path": parent, "light_type": light_type, "name": name}
-        if props:
-            params["properties"] = json.loads(props)
-        result = godot_call("resources.create_light", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    params = {"parent_path": parent, "light_type": light_type, "name": name}
+    if props:
+        params["properties"] = parse_json(props)
+    return params
 
 
 @resource_app.command("collision")
-def resource_collision(
-    node: str,
-    shape_type: str,
-    params: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("resources.create_collision_shape")
+def resource_collision(node: str, shape_type: str, params: Optional[str] = None):
     """Create collision shape."""
-    setup_logging(verbose)
-    try:
-        call_params = {"node_path": node, "shape_type": shape_type}
-        if params:
-            call_params["shape_params"] = json.loads(params)
-        result = godot_call("resources.create_collision_shape", call_params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    call_params = {"node_path": node, "shape_type": shape_type}
+    if params:
+        call_params["shape_params"] = parse_json(params)
+    return call_params
 
 
 # ============================================================================
@@ -636,91 +517,44 @@ app.add_typer(file_app, name="file")
 
 
 @file_app.command("search")
-def file_search(
-    pattern: str,
-    path: str = "res://",
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.search", raw_result=True)
+def file_search(pattern: str, path: str = "res://"):
     """Search files in project."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.search", {"pattern": pattern, "path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"pattern": pattern, "path": path}
 
 
 @file_app.command("read")
-def file_read(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.read_text", raw_field="content")
+def file_read(path: str):
     """Read file content."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.read_text", {"path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"path": path}
 
 
 @file_app.command("write")
-def file_write(
-    path: str,
-    content: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.write_text")
+def file_write(path: str, content: str):
     """Write file content."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.write_text", {"path": path, "content": content})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"path": path, "content": content}
 
 
 @file_app.command("mkdir")
-def file_mkdir(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.create_folder")
+def file_mkdir(path: str):
     """Create folder."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.create_folder", {"path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"path": path}
 
 
 @file_app.command("delete")
-def file_delete(
-    path: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("filesystem.delete")
+def file_delete(path: str):
     """Delete file or folder."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.delete", {"path": path})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"path": path}
 
 
 @file_app.command("refresh")
-def file_refresh(json_out: JsonOutput = False, verbose: Verbose = False):
+@rpc_command("filesystem.refresh")
+def file_refresh():
     """Refresh filesystem."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("filesystem.refresh")
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
 
 
 # ============================================================================
@@ -732,34 +566,17 @@ app.add_typer(introspect_app, name="introspect")
 
 
 @introspect_app.command("class")
-def introspect_class(
-    class_name: str,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("introspect.class_properties")
+def introspect_class(class_name: str):
     """Get class properties."""
-    setup_logging(verbose)
-    try:
-        result = godot_call("introspect.class_properties", {"class_name": class_name})
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"class_name": class_name}
 
 
 @introspect_app.command("catalog")
-def introspect_catalog(
-    category: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+@rpc_command("introspect.catalog", raw_result=True)
+def introspect_catalog(category: Optional[str] = None):
     """Get class catalog."""
-    setup_logging(verbose)
-    try:
-        params = {"category": category} if category else {}
-        result = godot_call("introspect.catalog", params)
-        output_result(result, json_out)
-    except Exception as e:
-        output_error(e, json_out)
+    return {"category": category} if category else {}
 
 
 # ============================================================================
@@ -767,22 +584,91 @@ def introspect_catalog(
 # ============================================================================
 
 @app.command("rpc")
-def raw_rpc(
-    method: str,
-    params: Optional[str] = None,
-    json_out: JsonOutput = False,
-    verbose: Verbose = False
-):
+def raw_rpc(ctx: typer.Context, method: str, params: Optional[str] = None):
     """Execute raw RPC method (for advanced use)."""
-    setup_logging(verbose)
     try:
-        call_params = json.loads(params) if params else {}
+        call_params = parse_json(params) if params else None
         result = godot_call(method, call_params)
-        output_result(result, json_out)
-    except json.JSONDecodeError as e:
-        output_error(ValueError(f"Invalid JSON params: {e}"), json_out)
-    except Exception as e:
-        output_error(e, json_out)
+        output_result(ctx, result)
+    except Exception as e:
+        output_error(ctx, e)
+
+
+@app.command("rpc-batch")
+def rpc_batch(ctx: typer.Context):
+    """Execute newline-delimited JSON RPC requests from stdin over one connection.
+
+    Each input line is {"method": ..., "params": ..., "id": ...}; one
+    {"id": ..., "result": ...} or {"id": ..., "error": ...} line is written
+    per request, in input order, as soon as it is available. Lines that are
+    not valid requests get an error line and the batch continues.
+    """
+    # One (id, error) slot per input line, in input order. error is None for
+    # requests sent to Godot, or the error member for rejected lines.
+    slots: deque[tuple[Any, dict[str, Any] | None]] = deque()
+    lock = threading.Lock()
+    calls = CallQueue()
+    out = sys.stdout.buffer
+
+    def write(line: dict[str, Any]) -> None:
+        out.write(dumps(line))
+        out.write(b"\n")
+        out.flush()
+
+    def write_rejected() -> None:
+        # Rejected lines are written once every request before them is answered
+        while slots and slots[0][1] is not None:
+            rid, error = slots.popleft()
+            write({"id": rid, "error": error})
+
+    def reject(rid: Any, code: int, message: str) -> None:
+        with lock:
+            slots.append((rid, {"code": code, "message": message, "data": None}))
+            write_rejected()
+
+    def read_requests() -> None:
+        try:
+            for line in iter(sys.stdin.buffer.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    req = loads(line)
+                except JSONDecodeError as e:
+                    reject(None, -32700, f"Invalid JSON request: {e}")
+                    continue
+                if not isinstance(req, dict):
+                    reject(None, -32600, "Request must be a JSON object")
+                    continue
+                method = req.get("method")
+                if not isinstance(method, str):
+                    reject(req.get("id"), -32600, "Request is missing a 'method' string")
+                    continue
+                with lock:
+                    slots.append((req.get("id"), None))
+                calls.put(method, req.get("params"))
+        finally:
+            calls.close()
+
+    # Read stdin on a separate thread so responses are written while the
+    # next request is still being typed or produced upstream.
+    threading.Thread(target=read_requests, daemon=True).start()
+    try:
+        with GodotClient() as client:
+            for result in client.call_many(calls):
+                with lock:
+                    rid, _ = slots.popleft()
+                    if isinstance(result, RPCError):
+                        write({"id": rid, "error": {
+                            "code": result.code,
+                            "message": result.message,
+                            "data": result.data
+                        }})
+                    else:
+                        write({"id": rid, "result": result})
+                    write_rejected()
+    except Exception as e:
+        out.flush()
+        output_error(ctx, e)
 
 
 # ============================================================================
@@ -790,29 +676,40 @@ def raw_rpc(
 # ============================================================================
 
 @app.command("status")
-def status(json_out: JsonOutput = False, verbose: Verbose = False):
+def status(
+    ctx: typer.Context,
+    full: bool = typer.Option(False, "--full", help="Also fetch the project name"),
+):
     """Check connection status to Godot."""
-    setup_logging(verbose)
     try:
-        client = GodotClient()
-        if client.connect():
+        persist = persistence_enabled()
+        if persist:
+            # Reuses the open connection, checked with auth.ping
+            client = get_shared_client(check=True)
+            connected = client.authenticated
+        else:
+            client = GodotClient()
+            connected = client.connect()
+        if connected:
             result = {
                 "connected": True,
                 "authenticated": client.authenticated,
                 "ws_url": client.config.ws_url
             }
-            # Get editor info
-            try:
-                info = client.call("project.get_info")
-                result["project"] = info.get("name", "unknown")
-            except:
-                pass
-            client.close()
-            output_result(result, json_out)
+            if full:
+                try:
+                    info = client.call("project.get_info")
+                    result["project"] = info.get("name", "unknown")
+                except Exception as e:
+                    # The project name is optional; report the connection regardless
+                    logger.debug("project.get_info failed: %s", e)
+            if not persist:
+                client.close()
+            output_result(ctx, result)
         else:
-            output_result({"connected": False}, json_out)
+            output_result(ctx, {"connected": False})
     except Exception as e:
-        output_error(e, json_out)
+        output_error(ctx, e)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+"""Tests for GodotClient against a scripted websocket."""
+
+import importlib
+import json
+import sys
+from collections import deque
+
+import pytest
+
+import godot_bridge.client
+
+
+class FakeWebSocket:
+    """Records sent requests and replays the frames ``respond`` returns for them."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.sent = []
+        self.frames = deque()
+        self.closed = False
+
+    def send(self, data, text=False):
+        request = json.loads(data)
+        self.sent.append(request)
+        self.frames.extend(frame.encode() for frame in self.respond(request))
+
+    def recv(self, decode=None):
+        return self.frames.popleft()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=["msgspec", "fallback"])
+def client_module(request, monkeypatch):
+    """The client module, once with msgspec and once with the plain JSON fallback."""
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+    # Restore the original objects afterwards so modules that imported them
+    # (godot_bridge.main) keep matching classes
+    namespace = dict(vars(godot_bridge.client))
+    yield importlib.reload(godot_bridge.client)
+    vars(godot_bridge.client).clear()
+    vars(godot_bridge.client).update(namespace)
+
+
+def connect(module, respond):
+    client = module.GodotClient(module.GodotConfig())
+    ws = FakeWebSocket(respond)
+    client.ws = ws
+    return client, ws
+
+
+def test_call_raw_returns_result_json(client_module):
+    result = {"name": "Root", "children": [{"name": "Child ü", "path": "a/b]}"}]}
+    client, _ = connect(client_module, lambda req: [
+        json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result, "meta": {"b": 2}},
+                   ensure_ascii=False)
+    ])
+    assert json.loads(bytes(client.call_raw("scene.get_tree"))) == result
+
+
+def test_call_raw_keeps_result_bytes_with_msgspec(client_module):
+    if client_module.msgspec is None:
+        pytest.skip("passthrough needs msgspec")
+    frame = '{"id": 1, "result": {"a" : [1, 2.50]}, "meta": {"b": 2}}'
+    client, _ = connect(client_module, lambda req: [frame])
+    assert bytes(client.call_raw("scene.get_tree")) == b'{"a" : [1, 2.50]}'
+
+
+def test_call_raw_accepts_string_id(client_module):
+    client, _ = connect(client_module, lambda req: [
+        json.dumps({"id": str(req["id"]), "result": [1]})
+    ])
+    assert bytes(client.call_raw("file.search")) == b"[1]"
+
+
+def test_call_raw_missing_result(client_module):
+    client, _ = connect(client_module, lambda req: [json.dumps({"id": req["id"]})])
+    assert bytes(client.call_raw("file.search")) == b"{}"
+
+
+def test_call_raw_error_member(client_module):
+    client, ws = connect(client_module, lambda req: [
+        json.dumps({"id": req["id"], "error": {"code": 7, "message": "boom", "data": [1]}})
+    ])
+    with pytest.raises(client_module.RPCError) as excinfo:
+        client.call_raw("file.search")
+    assert (excinfo.value.code, excinfo.value.message, excinfo.value.data) == (7, "boom", [1])
+    assert not ws.closed
+
+
+def test_call_raw_id_mismatch_closes(client_module):
+    client, ws = connect(client_module, lambda req: [json.dumps({"id": 99, "result": {}})])
+    with pytest.raises(client_module.RPCError, match="id mismatch"):
+        client.call_raw("file.search")
+    assert ws.closed
+    assert client.ws is None
+
+
+def echo(req):
+    return [json.dumps({"id": req["id"], "result": {"method": req["method"]}})]
+
+
+def test_call_many_reorders_responses(client_module):
+    held = []
+
+    def respond(req):
+        # Answer the first request only after the second, in reverse order
+        held.insert(0, json.dumps({"id": req["id"], "result": {"method": req["method"]}}))
+        return held if len(held) == 2 else []
+
+    client, ws = connect(client_module, respond)
+    results = list(client.call_many([("a", None), ("b", {"x": 1})]))
+    assert results == [{"method": "a"}, {"method": "b"}]
+    assert [req.get("params") for req in ws.sent] == [None, {"x": 1}]
+    assert not ws.closed
+
+
+def test_call_many_accepts_string_ids(client_module):
+    client, _ = connect(client_module, lambda req: [
+        json.dumps({"id": str(req["id"]), "result": {"method": req["method"]}})
+    ])
+    results = list(client.call_many([("a", None), ("b", None)]))
+    assert results == [{"method": "a"}, {"method": "b"}]
+
+
+def test_call_many_yields_rpc_errors(client_module):
+    def respond(req):
+        if req["method"] == "fail":
+            return [json.dumps({"id": req["id"], "error": {"code": 7, "message": "boom"}})]
+        return echo(req)
+
+    client, ws = connect(client_module, respond)
+    first, second, third = client.call_many([("a", None), ("fail", None), ("c", None)])
+    assert isinstance(second, client_module.RPCError) and second.code == 7
+    assert (first, third) == ({"method": "a"}, {"method": "c"})
+    assert not ws.closed
+
+
+def test_call_many_respects_window(client_module):
+    client, ws = connect(client_module, lambda req: [])
+    calls = client.call_many([(str(i), None) for i in range(5)], window=2)
+    with pytest.raises(IndexError):
+        next(calls)
+    assert len(ws.sent) == 2
+
+
+def test_call_many_id_mismatch_closes(client_module):
+    client, ws = connect(client_module, lambda req: [json.dumps({"id": 99, "result": {}})])
+    with pytest.raises(client_module.RPCError, match="id mismatch"):
+        list(client.call_many([("a", None), ("b", None)]))
+    assert ws.closed
+    assert client.ws is None
+
+
+def test_call_many_closes_when_abandoned_with_responses_outstanding(client_module):
+    client, ws = connect(client_module, echo)
+    calls = client.call_many([("a", None), ("b", None)])
+    assert next(calls) == {"method": "a"}
+    calls.close()
+    assert ws.closed
+
+
+def test_call_many_keeps_connection_when_finished(client_module):
+    client, ws = connect(client_module, echo)
+    calls = client.call_many([("a", None)])
+    assert next(calls) == {"method": "a"}
+    calls.close()
+    assert not ws.closed
+
+
+def test_call_many_yields_before_queue_is_closed(client_module):
+    client, ws = connect(client_module, echo)
+    queue = client_module.CallQueue()
+    calls = client.call_many(queue)
+    queue.put("a")
+    assert next(calls) == {"method": "a"}
+    queue.put("b", {"x": 1})
+    queue.close()
+    assert list(calls) == [{"method": "b"}]
+    assert ws.sent[1]["params"] == {"x": 1}
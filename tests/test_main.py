@@ -0,0 +1,42 @@
+"""Tests for CLI commands against a scripted websocket."""
+
+import json
+
+from typer.testing import CliRunner
+
+from godot_bridge import main
+from test_client import FakeWebSocket
+
+
+def test_rpc_batch_keeps_bad_lines_in_position(monkeypatch):
+    def respond(req):
+        if req["method"] == "fail":
+            return [json.dumps({"id": req["id"], "error": {"code": 7, "message": "boom"}})]
+        return [json.dumps({"id": req["id"], "result": {"method": req["method"]}})]
+
+    class FakeClient(main.GodotClient):
+        def connect(self):
+            self.ws = FakeWebSocket(respond)
+            return True
+
+    monkeypatch.setattr(main, "GodotClient", FakeClient)
+    lines = [
+        "not json",
+        '{"id": "a", "method": "first"}',
+        "[1]",
+        "",
+        '{"id": 2}',
+        '{"id": 3, "method": "fail"}',
+        '{"id": 4, "method": "last", "params": {"x": 1}}',
+        "{",
+    ]
+    result = CliRunner().invoke(main.app, ["rpc-batch"], input="\n".join(lines) + "\n")
+
+    assert result.exit_code == 0, result.output
+    output = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["id"] for line in output] == [None, "a", None, 2, 3, 4, None]
+    assert [line.get("error", {}).get("code") for line in output] == [
+        -32700, None, -32600, -32600, 7, None, -32700
+    ]
+    assert output[1]["result"] == {"method": "first"}
+    assert output[5]["result"] == {"method": "last"}